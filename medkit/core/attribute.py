@@ -2,6 +2,7 @@ from __future__ import annotations
 
 __all__ = ["Attribute"]
 
+import copy
 import dataclasses
 from typing import Any
 
@@ -30,6 +31,8 @@ class Attribute(dict_conv.SubclassMapping):
         The identifier of the attribute
     """
 
+    __slots__ = ("label", "value", "metadata", "uid")
+
     label: str
     value: Any | None
     metadata: dict[str, Any]
@@ -80,7 +83,14 @@ class Attribute(dict_conv.SubclassMapping):
         This is used when we want to duplicate an existing attribute onto a
         different annotation.
         """
-        return dataclasses.replace(self, uid=generate_id())
+        if type(self) is Attribute:
+            return Attribute(label=self.label, value=self.value, metadata=self.metadata)
+
+        # subclasses may have a different __init__ signature,
+        # so do a shallow copy and only replace the identifier
+        attr = copy.copy(self)
+        attr.uid = generate_id()
+        return attr
 
     @classmethod
     def from_dict(cls, attribute_dict: dict[str, Any]) -> Self:
@@ -3,6 +3,7 @@ from __future__ import annotations
 __all__ = ["AudioDocument"]
 
 import dataclasses
+import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Sequence
 
@@ -18,11 +19,15 @@ from medkit.core.audio.audio_buffer import (
     PlaceholderAudioBuffer,
 )
 from medkit.core.audio.span import Span
-from medkit.core.id import generate_deterministic_id, generate_id
+from medkit.core.id import generate_id
 
 if TYPE_CHECKING:
     import os
 
+# namespace used to derive raw segment identifiers from document identifiers,
+# it must never change, otherwise previously saved raw segment ids won't match
+_RAW_SEGMENT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "medkit:audio_document:raw_segment")
+
 
 @dataclasses.dataclass(init=False)
 class AudioDocument(dict_conv.SubclassMapping):
@@ -88,7 +93,7 @@ class AudioDocument(dict_conv.SubclassMapping):
 
     @classmethod
     def _generate_raw_segment(cls, audio: AudioBuffer, doc_id: str) -> Segment:
-        uid = str(generate_deterministic_id(reference_id=doc_id))
+        uid = str(uuid.uuid5(_RAW_SEGMENT_ID_NAMESPACE, doc_id))
 
         return Segment(
             label=cls.RAW_LABEL,
@@ -108,11 +113,10 @@ class AudioDocument(dict_conv.SubclassMapping):
     def to_dict(self, with_anns: bool = True) -> dict[str, Any]:
         # convert MemoryAudioBuffer to PlaceholderAudioBuffer
         # because we can't serialize the actual signal
-        if isinstance(self.audio, MemoryAudioBuffer):
-            placeholder = PlaceholderAudioBuffer.from_audio_buffer(self.audio)
-            audio = placeholder.to_dict()
-        else:
-            audio = self.audio.to_dict()
+        audio_buffer = self.audio
+        if isinstance(audio_buffer, MemoryAudioBuffer):
+            audio_buffer = PlaceholderAudioBuffer.from_audio_buffer(audio_buffer)
+        audio = audio_buffer.to_dict()
         doc_dict: dict[str, Any] = {
             "uid": self.uid,
             "audio": audio,
@@ -92,6 +92,8 @@ class DictConvertible(Protocol):
 class SubclassMapping:
     """Base class for managing subclasses."""
 
+    __slots__ = ()
+
     _subclasses: dict[str, type[Self]]
 
     def __init_subclass__(cls):
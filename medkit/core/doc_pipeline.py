@@ -79,15 +79,18 @@ class DocPipeline(DocOperation, Generic[AnnotationType]):
             annotations from each document, and all output annotations will also
             be added to each corresponding document.
         """
+        process_doc = self._process_doc
         for doc in docs:
-            self._process_doc(doc)
+            process_doc(doc)
 
     def _process_doc(self, doc: Document[AnnotationType]):
+        pipeline = self.pipeline
+        labels_by_input_key = self.labels_by_input_key
         all_input_anns = []
 
-        if self.labels_by_input_key is None:
+        if labels_by_input_key is None:
             # default to raw segment if no labels_by_input_key provided
-            if len(self.pipeline.input_keys) > 1:
+            if len(pipeline.input_keys) > 1:
                 msg = (
                     "Pipeline expects more than 1 input, you must provide a"
                     " labels_by_input_key mapping to the DocPipeline"
@@ -96,12 +99,14 @@ class DocPipeline(DocOperation, Generic[AnnotationType]):
             all_input_anns = [[doc.raw_segment]]
         else:
             # retrieve annotations by their label(s) for each input key
-            for input_key in self.pipeline.input_keys:
-                labels = self.labels_by_input_key[input_key]
-                input_anns = [ann for label in labels for ann in doc.anns.get(label=label)]
+            get_anns = doc.anns.get
+            for input_key in pipeline.input_keys:
+                input_anns = []
+                for label in labels_by_input_key[input_key]:
+                    input_anns.extend(get_anns(label=label))
                 all_input_anns.append(input_anns)
 
-        all_output_anns = self.pipeline.run(*all_input_anns)
+        all_output_anns = pipeline.run(*all_input_anns)
 
         # wrap output in tuple if necessary
         # (operations performing in-place modifications
@@ -117,6 +122,7 @@ class DocPipeline(DocOperation, Generic[AnnotationType]):
         all_output_anns = cast(Tuple[List[AnnotationType], ...], all_output_anns)
 
         # add output anns to doc
+        add_ann = doc.anns.add
         for output_anns in all_output_anns:
             for output_ann in output_anns:
-                doc.anns.add(output_ann)
+                add_ann(output_ann)
@@ -12,6 +12,7 @@ from medkit.core import dict_conv
 from medkit.core.attribute import Attribute
 from medkit.core.attribute_container import AttributeContainer
 from medkit.core.id import generate_id
+from medkit.core.text import span_utils
 from medkit.core.text.entity_attribute_container import EntityAttributeContainer
 from medkit.core.text.span import AnySpan
 
@@ -139,11 +140,27 @@ class Segment(TextAnnotation):
 
         self.text = text
         self.spans = spans
+        self._span_bounds: tuple[list[AnySpan], int, int] | None = None
 
         # check if spans length is equal to text length
         length = sum(s.length for s in self.spans)
         assert len(self.text) == length, "Spans length does not match text length"
 
+    def _get_span_bounds(self) -> tuple[int, int]:
+        """Return the start and end of the normalized spans of the segment.
+
+        The result is cached, and recomputed only if `spans` is reassigned.
+        Modifying `spans` in place (appending or assigning an item) is not
+        detected and returns stale bounds.
+        """
+        if self._span_bounds is None or self._span_bounds[0] is not self.spans:
+            spans_normalized = span_utils.normalize_spans(self.spans)
+            start = min(s.start for s in spans_normalized)
+            end = max(s.end for s in spans_normalized)
+            self._span_bounds = (self.spans, start, end)
+        _, start, end = self._span_bounds
+        return start, end
+
     def to_dict(self) -> dict[str, Any]:
         spans = [s.to_dict() for s in self.spans]
         attrs = [a.to_dict() for a in self.attrs]
@@ -10,7 +10,6 @@ from typing_extensions import Self
 
 from medkit.core import Attribute, AttributeContainer, dict_conv
 from medkit.core.id import generate_deterministic_id, generate_id
-from medkit.core.text import span_utils
 from medkit.core.text.annotation import Segment, TextAnnotation
 from medkit.core.text.annotation_container import TextAnnotationContainer
 from medkit.core.text.span import Span
@@ -213,9 +212,7 @@ class TextDocument(dict_conv.SubclassMapping):
         str
             A portion of the text around the annotation
         """
-        spans_normalized = span_utils.normalize_spans(segment.spans)
-        start = min(s.start for s in spans_normalized)
-        end = max(s.end for s in spans_normalized)
+        start, end = segment._get_span_bounds()
         start_extended = max(start - max_extend_length // 2, 0)
         remaining_max_extend_length = max_extend_length - (start - start_extended)
         end_extended = min(end + remaining_max_extend_length, len(self.text))
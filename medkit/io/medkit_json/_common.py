@@ -2,16 +2,27 @@ from __future__ import annotations
 
 __all__ = [
     "MEDKIT_JSON_VERSION",
+    "READ_BUFFER_SIZE",
+    "WRITE_BUFFER_SIZE",
     "ContentType",
     "build_header",
     "check_header",
+    "write_jsonl",
 ]
 
 import enum
-from typing import Any
+import functools
+import json
+from pathlib import Path
+from typing import Any, Iterable
 
 MEDKIT_JSON_VERSION = "0.2"
 
+# size of the read buffer used for jsonl files
+READ_BUFFER_SIZE = 1 << 17
+# size of the write buffer used for jsonl files
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class ContentType(enum.Enum):
     """Type of content.
@@ -55,3 +66,19 @@ def check_header(data, expected_content_type: ContentType):
             f" type (has {content_type.value} instead)"
         )
         raise RuntimeError(msg)
+
+
+def write_jsonl(
+    output_file: str | Path,
+    header: dict[str, Any],
+    data_dicts: Iterable[dict[str, Any]],
+    encoding: str | None = "utf-8",
+):
+    """Write a medkit-json header followed by one compact line per data dict."""
+    with Path(output_file).open(mode="w", encoding=encoding, buffering=WRITE_BUFFER_SIZE) as fp:
+        fp.write(_dumps_json(header) + "\n")
+        for data in data_dicts:
+            fp.write(_dumps_json(data) + "\n")
+
+
+_dumps_json = functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
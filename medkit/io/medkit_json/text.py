@@ -15,7 +15,7 @@ from pathlib import Path
 from typing import Iterable, Iterator
 
 from medkit.core.text import TextAnnotation, TextDocument
-from medkit.io.medkit_json._common import ContentType, build_header, check_header
+from medkit.io.medkit_json._common import READ_BUFFER_SIZE, ContentType, build_header, check_header, write_jsonl
 
 _DOC_ANNS_SUFFIX = "_anns.jsonl"
 
@@ -77,7 +77,7 @@ def load_text_documents(input_file: str | Path, encoding: str | None = "utf-8")
     --------
     save_text_documents : Save multiple text documents to JSON.
     """
-    with Path(input_file).open(encoding=encoding) as fp:
+    with Path(input_file).open(encoding=encoding, buffering=READ_BUFFER_SIZE) as fp:
         line = fp.readline()
         data = json.loads(line)
         check_header(data, ContentType.TEXT_DOCUMENT_LIST)
@@ -107,7 +107,7 @@ def load_text_anns(input_file: str | Path, encoding: str | None = "utf-8") -> It
     --------
     save_text_anns : Save text annotations to JSON.
     """
-    with Path(input_file).open(encoding=encoding) as fp:
+    with Path(input_file).open(encoding=encoding, buffering=READ_BUFFER_SIZE) as fp:
         line = fp.readline()
         data = json.loads(line)
         check_header(data, ContentType.TEXT_ANNOTATION_LIST)
@@ -187,12 +187,7 @@ def save_text_documents(
     load_text_documents : Load multiple text documents from JSON.
     """
     header = build_header(content_type=ContentType.TEXT_DOCUMENT_LIST)
-    with Path(output_file).open(mode="w", encoding=encoding) as fp:
-        fp.write(json.dumps(header, ensure_ascii=False) + "\n")
-
-        for doc in docs:
-            doc_data = doc.to_dict()
-            fp.write(json.dumps(doc_data, ensure_ascii=False) + "\n")
+    write_jsonl(output_file, header, (doc.to_dict() for doc in docs), encoding=encoding)
 
 
 def save_text_anns(
@@ -216,9 +211,4 @@ def save_text_anns(
     load_text_anns : Load text annotations from JSON.
     """
     header = build_header(content_type=ContentType.TEXT_ANNOTATION_LIST)
-    with Path(output_file).open(mode="w", encoding=encoding) as fp:
-        fp.write(json.dumps(header, ensure_ascii=False) + "\n")
-
-        for ann in anns:
-            ann_data = ann.to_dict()
-            fp.write(json.dumps(ann_data, ensure_ascii=False) + "\n")
+    write_jsonl(output_file, header, (ann.to_dict() for ann in anns), encoding=encoding)
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 __all__ = ["SeqEvalEvaluator", "SeqEvalMetricsComputer"]
 
+import collections
+import itertools
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from typing_extensions import Literal
 
 from medkit._import import import_optional
@@ -12,11 +15,35 @@ from medkit.text.ner import hf_tokenization_utils
 
 metrics = import_optional("seqeval.metrics", extra="metrics-ner")
 scheme_ = import_optional("seqeval.scheme", extra="metrics-ner")
+torch = import_optional("torch", extra="metrics-ner")
 
 if TYPE_CHECKING:
     from medkit.training.utils import BatchData
 
 
+def _group_entities_by_label(
+    y_all: list[list[str]],
+    tagging_scheme: Literal["bilou", "iob2"],
+) -> dict[str, set]:
+    """Extract the entities of all tag sequences, grouped by label."""
+    entities_by_label = collections.defaultdict(set)
+    if tagging_scheme == "bilou":
+        # 'bilou' only works with seqeval 'strict' mode
+        entities = scheme_.Entities(y_all, scheme_.BILOU).entities
+        for entity in itertools.chain.from_iterable(entities):
+            entities_by_label[entity.tag].add(entity)
+    else:
+        # seqeval default mode, compatible with conlleval
+        for label, start, end in metrics.sequence_labeling.get_entities(y_all):
+            entities_by_label[label].add((start, end))
+    return entities_by_label
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    # same as seqeval with zero_division=0
+    return np.divide(numerator, denominator, out=np.zeros(len(numerator)), where=denominator != 0)
+
+
 def _compute_seqeval_from_dict(
     y_true_all: list[list[str]],
     y_pred_all: list[list[str]],
@@ -24,32 +51,45 @@ def _compute_seqeval_from_dict(
     return_metrics_by_label: bool,
     average: Literal["macro", "weighted"],
 ) -> dict[str, float | int]:
-    """Compute seqeval metrics using preprocessed data."""
-    # internal configuration for seqeval
-    # 'bilou' only works with 'strict' mode
-    scheme = scheme_.BILOU if tagging_scheme == "bilou" else scheme_.IOB2
-    mode = "strict" if tagging_scheme == "bilou" else None
-
-    # returns precision, recall, F1 score for each class.
-    report = metrics.classification_report(
-        y_true=y_true_all,
-        y_pred=y_pred_all,
-        scheme=scheme,
-        output_dict=True,
-        zero_division=0,
-        mode=mode,
-    )
+    """Compute seqeval metrics using preprocessed data.
+
+    Entities are extracted only once for references and predictions, then
+    scores are computed as `seqeval.metrics.classification_report` would.
+    """
+    true_entities = _group_entities_by_label(y_true_all, tagging_scheme)
+    pred_entities = _group_entities_by_label(y_pred_all, tagging_scheme)
+    labels = sorted(true_entities.keys() | pred_entities.keys())
+
+    tp_sum = np.array([len(true_entities[label] & pred_entities[label]) for label in labels])
+    pred_sum = np.array([len(pred_entities[label]) for label in labels])
+    true_sum = np.array([len(true_entities[label]) for label in labels])
+
+    # precision, recall, F1 score for each label
+    precision = _safe_divide(tp_sum, pred_sum)
+    recall = _safe_divide(tp_sum, true_sum)
+    f1_score = _safe_divide(2 * precision * recall, precision + recall)
+
     # add average metrics
-    scores = {f"{average}_{key}": value for key, value in report[f"{average} avg"].items()}
-    scores["support"] = scores.pop(f"{average}_support")
-    scores["accuracy"] = metrics.accuracy_score(y_true=y_true_all, y_pred=y_pred_all)
+    if average == "weighted" and true_sum.sum() == 0:
+        avg_precision, avg_recall, avg_f1_score = 0.0, 0.0, 0.0
+    else:
+        weights = true_sum if average == "weighted" else None
+        avg_precision = np.average(precision, weights=weights)
+        avg_recall = np.average(recall, weights=weights)
+        avg_f1_score = np.average(f1_score, weights=weights)
+
+    scores = {
+        f"{average}_precision": avg_precision,
+        f"{average}_recall": avg_recall,
+        f"{average}_f1-score": avg_f1_score,
+        "support": sum(true_sum),
+        "accuracy": metrics.accuracy_score(y_true=y_true_all, y_pred=y_pred_all),
+    }
 
     if return_metrics_by_label:
-        for value_key in report:
-            if value_key.endswith("avg"):
-                continue
-            for metric_key, metric_value in report[value_key].items():
-                scores[f"{value_key}_{metric_key}"] = metric_value
+        for label, label_scores in zip(labels, zip(precision, recall, f1_score, true_sum)):
+            for metric_key, metric_value in zip(("precision", "recall", "f1-score", "support"), label_scores):
+                scores[f"{label}_{metric_key}"] = metric_value
 
     return scores
 
@@ -217,6 +257,16 @@ class SeqEvalMetricsComputer:
         self.return_metrics_by_label = return_metrics_by_label
         self.average = average
 
+        # labels indexed by tag id, to decode all the tags of a batch at once
+        nb_ids = max(id_to_label) + 1 if id_to_label else 0
+        self._labels_by_id = np.empty(nb_ids, dtype=object)
+        self._is_known_id = np.zeros(nb_ids, dtype=bool)
+        for tag_id, label in id_to_label.items():
+            self._labels_by_id[tag_id] = label
+            self._is_known_id[tag_id] = True
+        # smallest integer type holding all tag ids, to reduce device to host transfers
+        self._tag_ids_dtype = torch.int16 if len(self._labels_by_id) <= torch.iinfo(torch.int16).max else torch.int32
+
     def prepare_batch(self, model_output: BatchData, input_batch: BatchData) -> dict[str, list[list[str]]]:
         """Prepare a batch of tensors to compute the metric.
 
@@ -232,21 +282,34 @@ class SeqEvalMetricsComputer:
         dict of str to list of list of str
             A dictionary with the true and predicted tags representation of a batch data
         """
-        predictions_ids = model_output["logits"].argmax(dim=-1).detach().to("cpu").numpy()
-        references_ids = input_batch["labels"].detach().to("cpu").numpy()
+        predictions_ids = model_output["logits"].detach().argmax(dim=-1)
+        references_ids = input_batch["labels"].detach().to(predictions_ids.device)
+        # transfer predicted and reference tags to cpu at once
+        tag_ids = torch.stack([predictions_ids, references_ids]).to(self._tag_ids_dtype).cpu().numpy()  # noqa: PD013
+        predictions_ids, references_ids = tag_ids
         # ignore special tokens
         mask_special_tokens = references_ids != hf_tokenization_utils.SPECIAL_TAG_ID_HF
 
-        batch_true_tags = [
-            [self.id_to_label[tag] for tag in ref[mask]] for ref, mask in zip(references_ids, mask_special_tokens)
-        ]
+        if len(references_ids) == 0:
+            return {"y_true": [], "y_pred": []}
 
-        batch_pred_tags = [
-            [self.id_to_label[tag] for tag in pred[mask]] for pred, mask in zip(predictions_ids, mask_special_tokens)
-        ]
+        # decode the tags of the whole batch, then split them back by sequence
+        split_indices = np.cumsum(mask_special_tokens.sum(axis=1))[:-1]
+        true_tags = self._decode_tags(references_ids[mask_special_tokens])
+        pred_tags = self._decode_tags(predictions_ids[mask_special_tokens])
+        batch_true_tags = [tags.tolist() for tags in np.split(true_tags, split_indices)]
+        batch_pred_tags = [tags.tolist() for tags in np.split(pred_tags, split_indices)]
 
         return {"y_true": batch_true_tags, "y_pred": batch_pred_tags}
 
+    def _decode_tags(self, tag_ids: np.ndarray) -> np.ndarray:
+        if tag_ids.size and (
+            tag_ids.min() < 0 or tag_ids.max() >= len(self._labels_by_id) or not self._is_known_id[tag_ids].all()
+        ):
+            unknown_tag_id = next(tag_id for tag_id in tag_ids.tolist() if tag_id not in self.id_to_label)
+            raise KeyError(unknown_tag_id)
+        return self._labels_by_id[tag_ids]
+
     def compute(self, all_data: dict[str, list[Any]]) -> dict[str, float]:
         """Compute the metrics.
 
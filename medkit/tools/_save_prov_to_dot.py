@@ -2,6 +2,7 @@ from __future__ import annotations
 
 __all__ = ["save_prov_to_dot"]
 
+import os
 from pathlib import Path
 from typing import Any, Callable, TextIO
 
@@ -18,7 +19,7 @@ from medkit.core.text import Segment, TextDocument
 
 def save_prov_to_dot(
     prov_tracer: ProvTracer,
-    file: str | Path,
+    file: str | Path | TextIO,
     data_item_formatters: dict[type, Callable[[Any], str]] | None = None,
     op_formatter: Callable[[OperationDescription], str] | None = None,
     max_sub_prov_depth: int | None = None,
@@ -33,8 +34,8 @@ def save_prov_to_dot(
     ----------
     prov_tracer : ProvTracer
         Provenance tracer holding the provenance information to save.
-    file : str or Path
-        Path to the .dot file.
+    file : str, Path or file-like object
+        Path to the .dot file, or text stream to write the graph to.
     data_item_formatters : dict of type to Callable, optional
         Dict mapping data items types with callback functions returning the text
         to display for each data item of this type.
@@ -52,15 +53,20 @@ def save_prov_to_dot(
         attached to (not strictly provenance but can make things easier to
         understand).
     """
+    writer = _DotWriter(
+        data_item_formatters,
+        op_formatter,
+        max_sub_prov_depth,
+        show_attr_links,
+    )
+    writer.write_provs(prov_tracer)
+    # the whole graph is rendered in memory so that it can be written at once
+    dot_text = writer.getvalue()
+    if not isinstance(file, (str, os.PathLike)):
+        file.write(dot_text)
+        return
     with Path(file).open(mode="w") as fp:
-        writer = _DotWriter(
-            fp,
-            data_item_formatters,
-            op_formatter,
-            max_sub_prov_depth,
-            show_attr_links,
-        )
-        writer.write_provs(prov_tracer)
+        fp.write(dot_text)
 
 
 _DEFAULT_DATA_ITEMS_FORMATTERS = {
@@ -73,7 +79,6 @@ _DEFAULT_DATA_ITEMS_FORMATTERS = {
 class _DotWriter:
     def __init__(
         self,
-        fp: TextIO,
         data_item_formatters: dict[type, Callable[[Any], str]] | None,
         op_formatter: Callable[[OperationDescription], str] | None,
         max_sub_prov_depth: int | None,
@@ -82,15 +87,17 @@ class _DotWriter:
         if data_item_formatters is None:
             data_item_formatters = {}
 
-        self._fp = fp
+        self._parts: list[str] = []
         self._data_item_formatters = data_item_formatters
         self._op_formatter = op_formatter
         self._max_sub_prov_depth = max_sub_prov_depth
         self._show_attr_links = show_attr_links
+        # escaped labels of data items and operations, by uid
+        self._labels_cache: dict[str, str] = {}
 
     def write_provs(self, tracer: ProvTracer, current_sub_prov_depth: int = 0):
         if current_sub_prov_depth == 0:
-            self._fp.write("digraph {\n\n")
+            self._parts.append("digraph {\n\n")
 
         write_sub_prov = self._max_sub_prov_depth is None or current_sub_prov_depth < self._max_sub_prov_depth
 
@@ -103,29 +110,38 @@ class _DotWriter:
                 self.write_provs(sub_prov_tracer, current_sub_prov_depth + 1)
 
         if current_sub_prov_depth == 0:
-            self._fp.write("\n\n}")
+            self._parts.append("\n\n}")
 
     def _write_prov(self, prov: Prov):
         data_item = prov.data_item
-        data_item_label = self._format_data_item(data_item)
-        data_item_label = self._escape_quotes(data_item_label)
-        self._fp.write(f'"{data_item.uid}" [label="{data_item_label}"];\n')
-
-        if prov.op_desc is not None:
-            op_label = self._op_formatter(prov.op_desc) if self._op_formatter is not None else prov.op_desc.name
-            op_label = self._escape_quotes(op_label)
+        data_item_label = self._labels_cache.get(data_item.uid)
+        if data_item_label is None:
+            data_item_label = self._escape_quotes(self._format_data_item(data_item))
+            self._labels_cache[data_item.uid] = data_item_label
+        self._parts.append(f'"{data_item.uid}" [label="{data_item_label}"];\n')
+
+        op_desc = prov.op_desc
+        if op_desc is not None:
+            op_label = self._labels_cache.get(op_desc.uid)
+            if op_label is None:
+                op_label = self._op_formatter(op_desc) if self._op_formatter is not None else op_desc.name
+                op_label = self._escape_quotes(op_label)
+                self._labels_cache[op_desc.uid] = op_label
         else:
             op_label = "Unknown"
         for source_data_item in prov.source_data_items:
-            self._fp.write(f'"{source_data_item.uid}" -> "{data_item.uid}" [label="{op_label}"];\n')
-        self._fp.write("\n\n")
+            self._parts.append(f'"{source_data_item.uid}" -> "{data_item.uid}" [label="{op_label}"];\n')
+        self._parts.append("\n\n")
 
         if self._show_attr_links and isinstance(data_item, IdentifiableDataItemWithAttrs):
             for attr in data_item.attrs:
-                self._fp.write(
+                self._parts.append(
                     f'"{data_item.uid}" -> "{attr.uid}" [style=dashed, color=grey,' ' label="attr", fontcolor=grey];\n'
                 )
 
+    def getvalue(self) -> str:
+        return "".join(self._parts)
+
     def _format_data_item(self, data_item: IdentifiableDataItem):
         # must test first user-provided formatters then default
         # (can't merge the two in same dict, this might create unexpected
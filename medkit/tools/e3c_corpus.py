@@ -30,13 +30,28 @@ __all__ = [
     "CLINENTITY_LABEL",
 ]
 
+import codecs
+import functools
 import json
 import logging
+import operator
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator, TypeVar
 from xml.etree import ElementTree
 
+try:
+    from lxml import etree
+except ModuleNotFoundError:
+    etree = None
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 from medkit.core import generate_deterministic_id
 from medkit.core.text import Entity, Segment, Span, TextDocument, UMLSNormAttribute
 from medkit.io.medkit_json import save_text_documents
@@ -53,12 +68,71 @@ CLINENTITY_LABEL = "disorder"
 Label used by medkit for annotated clinical entities of E3C corpus
 """
 
+_T = TypeVar("_T")
+
+# number of files sent at once to each worker process
+_CHUNK_SIZE = 64
+# number of chunks submitted ahead of the consumer, per worker process
+_MAX_PENDING_CHUNKS_PER_JOB = 2
+
+# attributes of the <custom:METADATA> element used to build an E3CDocument
+_get_metadata_fields = operator.itemgetter(
+    "docAuthor",
+    "docDOI",
+    "docTime",
+    "docName",
+    "docUrl",
+    "docSource",
+    "docSourceUrl",
+    "docLicense",
+    "docLanguage",
+    "pubType",
+    "note",
+)
+
+
+def _check_n_jobs(n_jobs: int):
+    if n_jobs < 1:
+        msg = f"n_jobs must be at least 1, got {n_jobs}"
+        raise ValueError(msg)
+
+
+def _map_files(load_func: Callable[[Path], _T], filepaths: list[Path], n_jobs: int) -> Iterator[_T]:
+    """Apply `load_func` to each file, using `n_jobs` processes if greater than 1.
+
+    Results are yielded in the same order as `filepaths`. When using several
+    processes, chunks of files are submitted as results are consumed so that
+    only a few chunks are loaded ahead of the caller.
+    """
+    if n_jobs == 1:
+        yield from map(load_func, filepaths)
+        return
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        pending = deque()
+        try:
+            for start in range(0, len(filepaths), _CHUNK_SIZE):
+                chunk = filepaths[start : start + _CHUNK_SIZE]
+                pending.append(executor.submit(_load_files, load_func, chunk))
+                if len(pending) >= _MAX_PENDING_CHUNKS_PER_JOB * n_jobs:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # when the caller stops iterating early, don't load remaining chunks
+            for future in pending:
+                future.cancel()
+
+
+def _load_files(load_func: Callable[[Path], _T], filepaths: list[Path]) -> list[_T]:
+    return [load_func(filepath) for filepath in filepaths]
+
 
 @dataclass
 class E3CDocument:
     """Data structure of a JSON document from the E3C corpus."""
 
-    authors: list[dict]  # list of {'author': '<name>'}
+    authors: tuple[str, ...]
     doi: str
     publication_date: str
     id: str
@@ -75,10 +149,12 @@ class E3CDocument:
         """Return the metadata dict for medkit text document."""
         dict_repr = self.__dict__.copy()
         dict_repr.pop("text")
+        # same format as in E3C json documents
+        dict_repr["authors"] = [{"author": author} for author in self.authors]
         return dict_repr
 
 
-def load_document(filepath: str | Path, encoding: str = "utf-8") -> TextDocument:
+def load_document(filepath: str | Path, encoding: str | None = "utf-8") -> TextDocument:
     """Load a E3C corpus document (json document) as medkit text document.
 
     For example, one in data collection folder.
@@ -96,14 +172,25 @@ def load_document(filepath: str | Path, encoding: str = "utf-8") -> TextDocument
     TextDocument
         The corresponding medkit text document
     """
-    with Path(filepath).open(encoding=encoding) as f:
-        doc = E3CDocument(**json.load(f))
+    filepath = Path(filepath)
+    # orjson only decodes utf-8
+    if orjson is not None and encoding is not None and codecs.lookup(encoding).name == "utf-8":
+        doc_data = orjson.loads(filepath.read_bytes())
+    else:
+        with filepath.open(encoding=encoding) as f:
+            doc_data = json.load(f)
 
-        uid = str(generate_deterministic_id(doc.id))
-        return TextDocument(text=doc.text, uid=uid, metadata=doc.extract_metadata())
+    doc_data["authors"] = tuple(author["author"] for author in doc_data["authors"])
+    doc = E3CDocument(**doc_data)
+    uid = str(generate_deterministic_id(doc.id))
+    return TextDocument(text=doc.text, uid=uid, metadata=doc.extract_metadata())
 
 
-def load_data_collection(dir_path: Path | str, encoding: str = "utf-8") -> Iterator[TextDocument]:
+def load_data_collection(
+    dir_path: Path | str,
+    encoding: str | None = "utf-8",
+    n_jobs: int = 1,
+) -> Iterator[TextDocument]:
     """Load the E3C corpus data collection as medkit text documents.
 
     Parameters
@@ -113,14 +200,24 @@ def load_data_collection(dir_path: Path | str, encoding: str = "utf-8") -> Itera
         (e.g., /tmp/E3C-Corpus-2.0.0/data_collection/French/layer1)
     encoding : str, default="utf-8"
         The encoding of the files. Default: 'utf-8'
+    n_jobs : int, default=1
+        Number of processes used to load the files, must be at least 1. If
+        greater than 1, the files are loaded in parallel, only a few chunks of
+        files ahead of the iteration.
 
     Returns
     -------
     iterator of TextDocument
         An iterator on corresponding medkit text documents
     """
+    # checked before iterating, unlike the directory
+    _check_n_jobs(n_jobs)
+    return _load_data_collection(dir_path, encoding, n_jobs)
+
+
+def _load_data_collection(dir_path: Path | str, encoding: str | None, n_jobs: int) -> Iterator[TextDocument]:
     dir_path = Path(dir_path)
-    if not dir_path.exists() or not dir_path.is_dir():
+    if not dir_path.is_dir():
         msg = "%s is not a directory or does not exist"
         raise FileNotFoundError(msg, dir_path)
 
@@ -131,11 +228,16 @@ def load_data_collection(dir_path: Path | str, encoding: str = "utf-8") -> Itera
             " subdirectory inside data_collection",
             dir_path,
         )
-    for filepath in filepaths:
-        yield load_document(filepath, encoding=encoding)
+    load_func = functools.partial(load_document, encoding=encoding)
+    yield from _map_files(load_func, filepaths, n_jobs=n_jobs)
 
 
-def convert_data_collection_to_medkit(dir_path: Path | str, output_file: str | Path, encoding: str | None = "utf-8"):
+def convert_data_collection_to_medkit(
+    dir_path: Path | str,
+    output_file: str | Path,
+    encoding: str | None = "utf-8",
+    n_jobs: int = 1,
+):
     """Convert E3C corpus data collection to medkit jsonl file.
 
     Parameters
@@ -147,11 +249,75 @@ def convert_data_collection_to_medkit(dir_path: Path | str, output_file: str | P
         The medkit jsonl output file which will contain medkit text documents
     encoding : str, default="utf-8"
         The encoding of the files. Default: 'utf-8'
+    n_jobs : int, default=1
+        Number of processes used to load the files, must be at least 1. If
+        greater than 1, the files are loaded in parallel.
     """
-    docs = load_data_collection(dir_path=dir_path, encoding=encoding)
+    docs = load_data_collection(dir_path=dir_path, encoding=encoding, n_jobs=n_jobs)
     save_text_documents(docs=docs, output_file=output_file, encoding=encoding)
 
 
+class _E3CAnnotationTarget:
+    """XML parser target collecting the elements of an E3C annotated document.
+
+    Only the metadata, the text, the sentences and the clinical entities are
+    kept, so the full element tree is never built.
+    """
+
+    def __init__(self, keep_sentences: bool = False):
+        self.keep_sentences = keep_sentences
+        self.ns: dict[str, str] = {}
+        self.metadata: dict[str, str] = {}
+        self.text: str = ""
+        self.sentences: list[dict[str, str]] = []
+        self.clin_entities: list[dict[str, str]] = []
+        self._metadata_tag: str | None = None
+        self._sofa_tag: str | None = None
+        self._sentence_tag: str | None = None
+        self._clin_entity_tag: str | None = None
+
+    def start_ns(self, prefix: str, uri: str):
+        self.ns[prefix] = uri
+
+    def start(self, tag: str, attrib: dict[str, str]):
+        if self._clin_entity_tag is None:
+            # all namespaces are declared on the root element,
+            # qualify the tags we are looking for once
+            self._metadata_tag = f"{{{self.ns.get('custom')}}}METADATA"
+            self._sofa_tag = f"{{{self.ns.get('cas')}}}Sofa"
+            self._sentence_tag = f"{{{self.ns.get('type4')}}}Sentence"
+            self._clin_entity_tag = f"{{{self.ns.get('custom')}}}CLINENTITY"
+
+        if tag == self._clin_entity_tag:
+            self.clin_entities.append(attrib)
+        elif tag == self._sentence_tag:
+            if self.keep_sentences:
+                self.sentences.append(attrib)
+        elif tag == self._metadata_tag:
+            self.metadata = attrib
+        elif tag == self._sofa_tag:
+            self.text = attrib.get("sofaString", "")
+
+    def end(self, tag: str):
+        pass
+
+    def close(self) -> _E3CAnnotationTarget:
+        return self
+
+
+def _parse_annotated_document(filepath: str | Path, encoding: str, keep_sentences: bool) -> _E3CAnnotationTarget:
+    target = _E3CAnnotationTarget(keep_sentences=keep_sentences)
+    if etree is not None:
+        # never resolve entities, as with the ElementTree parser
+        xml_parser = etree.XMLParser(target=target, encoding=encoding, resolve_entities=False)
+    else:
+        xml_parser = ElementTree.XMLParser(target=target, encoding=encoding)
+
+    with Path(filepath).open("rb") as f:
+        xml_parser.feed(f.read())
+    return xml_parser.close()
+
+
 def load_annotated_document(filepath: str | Path, encoding: str = "utf-8", keep_sentences=False) -> TextDocument:
     """Load a E3C corpus annotated document (xml document) as medkit text document.
 
@@ -175,25 +341,33 @@ def load_annotated_document(filepath: str | Path, encoding: str = "utf-8", keep_
     TextDocument
         The corresponding medkit text document
     """
-    xml_parser = ElementTree.XMLParser(encoding=encoding)
-    root = ElementTree.parse(filepath, parser=xml_parser).getroot()
-    # get xml namespaces
-    ns = dict([node for _, node in ElementTree.iterparse(filepath, events=["start-ns"])])
-    metadata = root.find("custom:METADATA", ns).attrib
-    text = root.find("cas:Sofa", ns).attrib.get("sofaString", "")
+    parsed = _parse_annotated_document(filepath, encoding=encoding, keep_sentences=keep_sentences)
+    (
+        doc_author,
+        doi,
+        publication_date,
+        doc_name,
+        url,
+        source,
+        source_url,
+        licence,
+        language,
+        pub_type,
+        note,
+    ) = _get_metadata_fields(parsed.metadata)
     doc = E3CDocument(
-        authors=[{"author": author.strip()} for author in metadata["docAuthor"].split(";")],
-        doi=metadata["docDOI"],
-        publication_date=metadata["docTime"],
-        id=metadata["docName"],
-        url=metadata["docUrl"],
-        source=metadata["docSource"],
-        source_url=metadata["docSourceUrl"],
-        licence=metadata["docLicense"],
-        language=metadata["docLanguage"],
-        type=metadata["pubType"],
-        description=metadata["note"],
-        text=text,
+        authors=tuple(author.strip() for author in doc_author.split(";")),
+        doi=doi,
+        publication_date=publication_date,
+        id=doc_name,
+        url=url,
+        source=source,
+        source_url=source_url,
+        licence=licence,
+        language=language,
+        type=pub_type,
+        description=note,
+        text=parsed.text,
     )
 
     # create medkit text document
@@ -202,8 +376,7 @@ def load_annotated_document(filepath: str | Path, encoding: str = "utf-8", keep_
 
     # parse sentences if wanted by user
     if keep_sentences:
-        for elem in root.findall("type4:Sentence", ns):
-            sentence = elem.attrib
+        for sentence in parsed.sentences:
             span = Span(int(sentence["begin"]), int(sentence["end"]))
             sentence_uid = sentence["{http://www.omg.org/XMI}id"]
 
@@ -219,8 +392,7 @@ def load_annotated_document(filepath: str | Path, encoding: str = "utf-8", keep_
             medkit_doc.anns.add(medkit_sentence)
 
     # parse clinical entities
-    for elem in root.findall("custom:CLINENTITY", ns):
-        clin_entity = elem.attrib
+    for clin_entity in parsed.clin_entities:
         span = Span(int(clin_entity["begin"]), int(clin_entity["end"]))
         entity_uid = clin_entity["{http://www.omg.org/XMI}id"]  # retrieve xmi:id from attributes
 
@@ -257,6 +429,7 @@ def load_data_annotation(
     dir_path: Path | str,
     encoding: str = "utf-8",
     keep_sentences: bool = False,
+    n_jobs: int = 1,
 ) -> Iterator[TextDocument]:
     """Load the E3C corpus data annotation as medkit text documents.
 
@@ -269,14 +442,29 @@ def load_data_annotation(
         The encoding of the files. Default: 'utf-8'
     keep_sentences : bool, default=False
         Whether to load sentences into medkit documents.
+    n_jobs : int, default=1
+        Number of processes used to load the files, must be at least 1. If
+        greater than 1, the files are loaded in parallel, only a few chunks of
+        files ahead of the iteration.
 
     Returns
     -------
     iterator of TextDocument
         An iterator on corresponding medkit text documents
     """
+    # checked before iterating, unlike the directory
+    _check_n_jobs(n_jobs)
+    return _load_data_annotation(dir_path, encoding, keep_sentences, n_jobs)
+
+
+def _load_data_annotation(
+    dir_path: Path | str,
+    encoding: str,
+    keep_sentences: bool,
+    n_jobs: int,
+) -> Iterator[TextDocument]:
     dir_path = Path(dir_path)
-    if not dir_path.exists() or not dir_path.is_dir():
+    if not dir_path.is_dir():
         msg = "%s is not a directory or does not exist"
         raise FileNotFoundError(msg, dir_path)
 
@@ -287,8 +475,8 @@ def load_data_annotation(
             " subdirectory inside data_annotation",
             dir_path,
         )
-    for filepath in filepaths:
-        yield load_annotated_document(filepath, encoding=encoding, keep_sentences=keep_sentences)
+    load_func = functools.partial(load_annotated_document, encoding=encoding, keep_sentences=keep_sentences)
+    yield from _map_files(load_func, filepaths, n_jobs=n_jobs)
 
 
 def convert_data_annotation_to_medkit(
@@ -296,6 +484,7 @@ def convert_data_annotation_to_medkit(
     output_file: str | Path,
     encoding: str | None = "utf-8",
     keep_sentences: bool = False,
+    n_jobs: int = 1,
 ):
     """Convert E3C corpus data annotation to medkit jsonl file.
 
@@ -310,10 +499,14 @@ def convert_data_annotation_to_medkit(
         The encoding of the files. Default: 'utf-8'
     keep_sentences : bool, default=False
         Whether to load sentences into medkit documents.
+    n_jobs : int, default=1
+        Number of processes used to load the files, must be at least 1. If
+        greater than 1, the files are loaded in parallel.
     """
     docs = load_data_annotation(
         dir_path=dir_path,
         encoding=encoding,
         keep_sentences=keep_sentences,
+        n_jobs=n_jobs,
     )
     save_text_documents(docs=docs, output_file=output_file, encoding=encoding)
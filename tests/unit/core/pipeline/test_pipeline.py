@@ -468,3 +468,48 @@ def test_input_aggregation():
 
     # operation was properly called to generate new data item
     assert [a.text.upper() for a in sentence_segs_1 + sentence_segs_2] == [a.text for a in uppercased_segs]
+
+
+def test_description():
+    """Description reflects modifications made to the pipeline after init"""
+    inner_step = PipelineStep(
+        operation=_Uppercaser(),
+        input_keys=["SENTENCE"],
+        output_keys=["UPPERCASE"],
+    )
+    inner_pipeline = Pipeline(steps=[inner_step], input_keys=["SENTENCE"], output_keys=["UPPERCASE"], name="inner")
+    step = PipelineStep(
+        operation=inner_pipeline,
+        input_keys=["SENTENCE"],
+        output_keys=["UPPERCASE"],
+    )
+    pipeline = Pipeline(steps=[step], input_keys=["SENTENCE"], output_keys=["UPPERCASE"])
+    assert pipeline.description.config["steps"][0]["operation"].name == "inner"
+
+    # steps list modified
+    pipeline.steps.append(
+        PipelineStep(
+            operation=_Prefixer(prefix="Hello! "),
+            input_keys=["UPPERCASE"],
+            output_keys=["PREFIX"],
+        )
+    )
+    pipeline.output_keys = ["PREFIX"]
+    description = pipeline.description
+    assert len(description.config["steps"]) == 2
+    assert description.config["output_keys"] == ["PREFIX"]
+
+    # step modified in place
+    pipeline.steps[0].input_keys = ["OTHER_SENTENCE"]
+    assert pipeline.description.config["steps"][0]["input_keys"] == ["OTHER_SENTENCE"]
+
+    # nested pipeline renamed and its steps modified
+    inner_pipeline.name = "renamed_inner"
+    inner_pipeline.steps.clear()
+    inner_description = pipeline.description.config["steps"][0]["operation"]
+    assert inner_description.name == "renamed_inner"
+    assert inner_description.config["steps"] == []
+
+    # uid modified
+    pipeline.uid = "new_uid"
+    assert pipeline.description.uid == "new_uid"
@@ -0,0 +1,24 @@
+from medkit.core import Attribute
+from medkit.core.text import EntityNormAttribute
+
+
+def test_copy():
+    attr = Attribute(label="negation", value=True, metadata={"score": 0.8})
+    copied = attr.copy()
+
+    assert type(copied) is Attribute
+    assert copied.uid != attr.uid
+    assert copied.label == attr.label
+    assert copied.value == attr.value
+    assert copied.metadata == attr.metadata
+
+
+def test_copy_subclass():
+    attr = EntityNormAttribute(kb_name="umls", kb_id="C0011849", score=0.9)
+    copied = attr.copy()
+
+    assert type(copied) is EntityNormAttribute
+    assert copied.uid != attr.uid
+    assert copied.value == "umls:C0011849"
+    assert copied.kb_id == attr.kb_id
+    assert copied.score == attr.score
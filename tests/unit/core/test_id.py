@@ -1,6 +1,7 @@
 import uuid
 
-from medkit.core import generate_deterministic_id
+import medkit.core.id
+from medkit.core import generate_deterministic_id, generate_id
 
 
 def test_deterministic_id():
@@ -10,3 +11,10 @@ def test_deterministic_id():
     # simulate another call
     second_deterministic_uuid = generate_deterministic_id(uid)
     assert first_deterministic_uuid == second_deterministic_uuid
+
+
+def test_fast_ids(monkeypatch):
+    monkeypatch.setattr(medkit.core.id, "_FAST_IDS", True)
+    uids = [generate_id() for _ in range(100)]
+    assert len(set(uids)) == len(uids)
+    assert all(isinstance(uid, str) for uid in uids)
@@ -115,6 +115,22 @@ def test_snippet():
     assert snippet == expected
 
 
+def test_snippet_after_spans_reassigned():
+    doc = get_text_document("doc1")
+    entity = Segment(
+        label="disease",
+        spans=[Span(739, 755)],
+        text="neurofibromatose",
+    )
+    doc.anns.add(entity)
+    assert doc.get_snippet(entity, max_extend_length=0) == "neurofibromatose"
+
+    # span bounds must be recomputed when spans are reassigned
+    entity.spans = [Span(739, 745)]
+    entity.text = "neurof"
+    assert doc.get_snippet(entity, max_extend_length=0) == "neurof"
+
+
 def test_from_dir():
     dir_ = Path("tests/data/text")
     docs = TextDocument.from_dir(dir_, pattern="doc[1-3].txt")
@@ -9,6 +9,7 @@ __all__ = [
     "SPLIT_DOC_ANNS_JSONL_FILE",
 ]
 
+import functools
 from pathlib import Path
 
 from medkit.core import Attribute
@@ -24,6 +25,9 @@ _AUDIO_FILE_1 = Path("tests/data/audio/dialog_long.ogg")
 _AUDIO_FILE_2 = Path("tests/data/audio/dialog.ogg")
 
 
+# builders are memoized, the objects they return are shared between tests
+# and must not be modified
+@functools.lru_cache(maxsize=None)
 def build_doc():
     """Build an audio doc with 2 segments and 1 attribute on the 1st segment"""
     audio = FileAudioBuffer(_AUDIO_FILE_1)
@@ -47,6 +51,7 @@ def build_doc():
     return doc
 
 
+@functools.lru_cache(maxsize=None)
 def build_docs():
     """Build 2 audio docs with 1 segment each"""
     audio_1 = FileAudioBuffer(_AUDIO_FILE_1)
@@ -72,6 +77,7 @@ def build_docs():
     return [doc_1, doc_2]
 
 
+@functools.lru_cache(maxsize=None)
 def build_anns():
     """Build 2 segments with 1 attribute on the 1st segment"""
     audio = FileAudioBuffer(_AUDIO_FILE_1)
@@ -1,3 +1,5 @@
+from itertools import zip_longest
+
 from medkit.io import medkit_json
 from tests.unit.io.medkit_json._audio_common import (
     ANNS_JSONL_FILE,
@@ -10,6 +12,8 @@ from tests.unit.io.medkit_json._audio_common import (
     build_docs,
 )
 
+_MISSING = object()
+
 
 def test_load_document():
     doc = medkit_json.load_audio_document(DOC_JSON_FILE)
@@ -22,14 +26,16 @@ def test_load_documents():
     docs = medkit_json.load_audio_documents(DOCS_JSONL_FILE)
 
     expected_docs = build_docs()
-    assert list(docs) == expected_docs
+    for doc, expected_doc in zip_longest(docs, expected_docs, fillvalue=_MISSING):
+        assert doc == expected_doc
 
 
 def test_load_anns():
     anns = medkit_json.load_audio_anns(ANNS_JSONL_FILE)
 
     expected_anns = build_anns()
-    assert list(anns) == expected_anns
+    for ann, expected_ann in zip_longest(anns, expected_anns, fillvalue=_MISSING):
+        assert ann == expected_ann
 
 
 def test_load_document_split():
@@ -1,5 +1,12 @@
+import json
+import math
+from datetime import date
 from pathlib import Path
 
+import numpy as np
+import pytest
+
+from medkit.core.text import TextDocument
 from medkit.io import medkit_json
 from tests.unit.io.medkit_json._text_common import (
     ANNS_JSONL_FILE,
@@ -55,3 +62,31 @@ def test_save_document_split(tmp_path):
 
     _check_json_files_are_equal(output_file, SPLIT_DOC_JSON_FILE)
     _check_json_files_are_equal(anns_output_file, SPLIT_DOC_ANNS_JSONL_FILE)
+
+
+def test_save_documents_special_values(tmp_path):
+    """Values accepted by the json module but not by all json libraries"""
+    doc = TextDocument(
+        text="Hello",
+        metadata={"score": np.float64(0.5), "big_int": 2**70, "nan": float("nan"), "inf": float("inf")},
+    )
+
+    output_file = tmp_path / "docs.jsonl"
+    medkit_json.save_text_documents([doc], output_file)
+
+    doc_line = output_file.read_text().splitlines()[1]
+    assert "NaN" in doc_line
+    metadata = json.loads(doc_line)["metadata"]
+    assert metadata["score"] == 0.5
+    assert metadata["big_int"] == 2**70
+    assert math.isnan(metadata["nan"])
+    assert metadata["inf"] == float("inf")
+
+
+def test_save_documents_unsupported_value(tmp_path):
+    """Values not supported by the json module are rejected"""
+    doc = TextDocument(text="Hello", metadata={"date": date(2020, 1, 1)})
+
+    output_file = tmp_path / "docs.jsonl"
+    with pytest.raises(TypeError):
+        medkit_json.save_text_documents([doc], output_file)
@@ -1,10 +1,15 @@
+import random
+
 import pytest
 from numpy.testing import assert_almost_equal
 
 _ = pytest.importorskip(modname="seqeval", reason="seqeval is not installed")
 torch = pytest.importorskip(modname="torch", reason="torch is not installed")
 
-from medkit.text.metrics.ner import SeqEvalMetricsComputer
+from seqeval import metrics as seqeval_metrics
+from seqeval import scheme as seqeval_scheme
+
+from medkit.text.metrics.ner import SeqEvalMetricsComputer, _compute_seqeval_from_dict
 from medkit.training import BatchData
 
 
@@ -233,3 +238,95 @@ def test_seqeval_metrics_bilou():
 
     assert_almost_equal(metrics["macro_precision"], 0.0, decimal=2)
     assert_almost_equal(metrics["corporation_precision"], 0.0, decimal=2)
+
+
+def test_prepare_empty_batch(id_to_label_bio):
+    metrics_computer = SeqEvalMetricsComputer(id_to_label=id_to_label_bio, tagging_scheme="iob2")
+    nb_labels = len(id_to_label_bio)
+    model_output = BatchData({"logits": torch.zeros((0, 8, nb_labels))})
+    input_batch = BatchData({"labels": torch.zeros((0, 8), dtype=torch.long)})
+
+    prepared_data = metrics_computer.prepare_batch(input_batch=input_batch, model_output=model_output)
+    assert prepared_data == {"y_true": [], "y_pred": []}
+
+
+def test_unknown_tag_id(input_batch):
+    # tag id 1 of the reference labels is missing
+    metrics_computer = SeqEvalMetricsComputer(id_to_label={0: "O", 3: "B-language"}, tagging_scheme="iob2")
+    model_output = _mock_model_output(nb_tokens=8, nb_labels=4, predicted_labels_ids=[0] * 8)
+
+    with pytest.raises(KeyError):
+        metrics_computer.prepare_batch(input_batch=input_batch, model_output=model_output)
+
+
+def _get_random_tags(rng, tag_prefixes, seq_lengths):
+    labels = ["PER", "LOC", "ORG"]
+    return [
+        ["O" if rng.random() < 0.4 else f"{rng.choice(tag_prefixes)}-{rng.choice(labels)}" for _ in range(n)]
+        for n in seq_lengths
+    ]
+
+
+def _compute_seqeval_with_classification_report(y_true, y_pred, tagging_scheme, average):
+    # reference implementation, relying on seqeval classification_report
+    report = seqeval_metrics.classification_report(
+        y_true=y_true,
+        y_pred=y_pred,
+        scheme=seqeval_scheme.BILOU if tagging_scheme == "bilou" else seqeval_scheme.IOB2,
+        output_dict=True,
+        zero_division=0,
+        mode="strict" if tagging_scheme == "bilou" else None,
+    )
+    scores = {f"{average}_{key}": value for key, value in report[f"{average} avg"].items()}
+    scores["support"] = scores.pop(f"{average}_support")
+    scores["accuracy"] = seqeval_metrics.accuracy_score(y_true=y_true, y_pred=y_pred)
+    for label, label_metrics in report.items():
+        if not label.endswith("avg"):
+            for metric_key, metric_value in label_metrics.items():
+                scores[f"{label}_{metric_key}"] = metric_value
+    return scores
+
+
+@pytest.mark.filterwarnings("ignore:Mean of empty slice")
+@pytest.mark.filterwarnings("ignore:invalid value encountered")
+@pytest.mark.parametrize("tagging_scheme", ["iob2", "bilou"])
+@pytest.mark.parametrize("average", ["macro", "weighted"])
+@pytest.mark.parametrize("references", ["random", "all_outside"])
+@pytest.mark.parametrize("seed", range(5))
+def test_scores_same_as_classification_report(tagging_scheme, average, references, seed):
+    rng = random.Random(seed)  # noqa: S311
+    tag_prefixes = ["B", "I", "L", "U"] if tagging_scheme == "bilou" else ["B", "I"]
+    seq_lengths = [rng.randint(1, 12) for _ in range(30)]
+    y_pred = _get_random_tags(rng, tag_prefixes, seq_lengths)
+    if references == "random":
+        y_true = _get_random_tags(rng, tag_prefixes, seq_lengths)
+    else:
+        y_true = [["O"] * n for n in seq_lengths]
+
+    scores = _compute_seqeval_from_dict(
+        y_true_all=y_true,
+        y_pred_all=y_pred,
+        tagging_scheme=tagging_scheme,
+        return_metrics_by_label=True,
+        average=average,
+    )
+    expected_scores = _compute_seqeval_with_classification_report(y_true, y_pred, tagging_scheme, average)
+    assert scores == pytest.approx(expected_scores, nan_ok=True)
+
+
+@pytest.mark.filterwarnings("ignore:Mean of empty slice")
+@pytest.mark.filterwarnings("ignore:invalid value encountered")
+@pytest.mark.parametrize("tagging_scheme", ["iob2", "bilou"])
+@pytest.mark.parametrize("average", ["macro", "weighted"])
+def test_scores_same_as_classification_report_without_entities(tagging_scheme, average):
+    y_true = y_pred = [["O", "O"], ["O"]]
+
+    scores = _compute_seqeval_from_dict(
+        y_true_all=y_true,
+        y_pred_all=y_pred,
+        tagging_scheme=tagging_scheme,
+        return_metrics_by_label=True,
+        average=average,
+    )
+    expected_scores = _compute_seqeval_with_classification_report(y_true, y_pred, tagging_scheme, average)
+    assert scores == pytest.approx(expected_scores, nan_ok=True)
@@ -1,6 +1,9 @@
+from pathlib import Path
+
 import pytest
 
 from medkit.io.medkit_json import load_text_documents
+from medkit.tools import e3c_corpus
 from medkit.tools.e3c_corpus import (
     convert_data_annotation_to_medkit,
     convert_data_collection_to_medkit,
@@ -30,3 +33,70 @@ def test_convert_data_annotation_to_medkit(e3c_corpus_path, tmpdir):
     docs_from_medkit = list(load_text_documents(medkit_file))
 
     assert docs_from_corpus == docs_from_medkit
+
+
+@pytest.fixture(params=["lxml", "ElementTree"])
+def xml_parser(request, monkeypatch):
+    """Run tests with the lxml parser and with the ElementTree fallback"""
+    if request.param == "lxml" and e3c_corpus.etree is None:
+        pytest.skip("lxml is not installed")
+    if request.param == "ElementTree":
+        monkeypatch.setattr(e3c_corpus, "etree", None)
+    return request.param
+
+
+def test_load_data_annotation(e3c_corpus_path, xml_parser):
+    docs = list(load_data_annotation(dir_path=e3c_corpus_path, keep_sentences=True))
+    assert len(docs) == 1
+    doc = docs[0]
+    assert doc.metadata["id"] == "FR100003"
+    assert doc.anns.get(label="sentence")
+    entities = doc.anns.get(label="disorder")
+    assert entities
+    for entity in entities:
+        assert entity.text == doc.text[entity.spans[0].start : entity.spans[-1].end]
+
+
+def test_load_data_collection_without_orjson(e3c_corpus_path, monkeypatch):
+    docs = list(load_data_collection(dir_path=e3c_corpus_path))
+    # force the json module to be used
+    monkeypatch.setattr(e3c_corpus, "orjson", None)
+    assert list(load_data_collection(dir_path=e3c_corpus_path)) == docs
+
+
+def test_convert_data_collection_without_encoding(e3c_corpus_path, tmpdir):
+    medkit_file = tmpdir / "medkit.jsonl"
+    convert_data_collection_to_medkit(dir_path=e3c_corpus_path, output_file=medkit_file, encoding=None)
+    docs_from_corpus = list(load_data_collection(dir_path=e3c_corpus_path, encoding=None))
+    docs_from_medkit = list(load_text_documents(medkit_file, encoding=None))
+    assert docs_from_corpus == docs_from_medkit
+    assert docs_from_corpus == list(load_data_collection(dir_path=e3c_corpus_path))
+
+
+def test_load_data_in_parallel(e3c_corpus_path):
+    docs = list(load_data_collection(dir_path=e3c_corpus_path))
+    docs_parallel = list(load_data_collection(dir_path=e3c_corpus_path, n_jobs=2))
+    assert docs_parallel == docs
+
+    docs = list(load_data_annotation(dir_path=e3c_corpus_path, keep_sentences=True))
+    docs_parallel = list(load_data_annotation(dir_path=e3c_corpus_path, keep_sentences=True, n_jobs=2))
+    assert docs_parallel == docs
+
+
+@pytest.mark.parametrize("load_func", [load_data_collection, load_data_annotation])
+def test_invalid_n_jobs(e3c_corpus_path, load_func):
+    with pytest.raises(ValueError, match="n_jobs must be at least 1"):
+        load_func(dir_path=e3c_corpus_path, n_jobs=0)
+
+
+def test_map_files_in_parallel(monkeypatch):
+    monkeypatch.setattr(e3c_corpus, "_CHUNK_SIZE", 3)
+    filepaths = [Path(f"file_{i}.xml") for i in range(50)]
+
+    # results are in the same order as files, across chunks
+    assert list(e3c_corpus._map_files(str, filepaths, n_jobs=2)) == [str(p) for p in filepaths]
+
+    # stop iterating early
+    results = e3c_corpus._map_files(str, filepaths, n_jobs=2)
+    assert next(results) == str(filepaths[0])
+    results.close()
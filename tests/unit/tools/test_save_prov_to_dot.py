@@ -1,7 +1,20 @@
+import io
+import re
+from pathlib import Path, PurePath
+
+import pytest
+
 from medkit.core import Attribute, OperationDescription, ProvTracer, generate_id
 from medkit.core.text import Entity, Segment, Span
 from medkit.tools import save_prov_to_dot
 
+# source uid, target uid and label of an edge entry
+_EDGE_RE = re.compile(r'^"([^"]+)" -> "([^"]+)" \[label="([^"]*)"\];$', flags=re.MULTILINE)
+
+
+def _get_edges(dot_text):
+    return set(_EDGE_RE.findall(dot_text))
+
 
 def _get_segment_and_entity(with_attr=False):
     sentence_segment = Segment(label="sentence", text="This is a sentence.", spans=[Span(0, 19)])
@@ -27,53 +40,83 @@ def _build_prov(prov_tracer, sentence_segment, syntagma_segment, entity):
         prov_tracer.add_prov(attr, neg_detector_desc, source_data_items=[syntagma_segment])
 
 
-def test_basic(tmp_path):
-    """Basic usage"""
-    # build provenance
-    sentence_segment, syntagma_segment, entity = _get_segment_and_entity()
+@pytest.fixture(scope="module")
+def segments_and_entity():
+    return _get_segment_and_entity()
+
+
+@pytest.fixture(scope="module")
+def prov_tracer(segments_and_entity):
+    # provenance is only read when rendering, so it can be built once and shared
     prov_tracer = ProvTracer()
-    _build_prov(prov_tracer, sentence_segment, syntagma_segment, entity)
+    _build_prov(prov_tracer, *segments_and_entity)
+    return prov_tracer
+
+
+@pytest.fixture(scope="module")
+def expected_edges(segments_and_entity):
+    # edges expected for the operations of _build_prov(), by operation name
+    sentence_segment, syntagma_segment, entity = segments_and_entity
+    return {
+        "SyntagmaTokenizer": (sentence_segment.uid, syntagma_segment.uid, "SyntagmaTokenizer"),
+        "EntityMatcher": (syntagma_segment.uid, entity.uid, "EntityMatcher"),
+    }
+
+
+def test_basic(prov_tracer, segments_and_entity, expected_edges):
+    """Basic usage"""
+    sentence_segment, syntagma_segment, entity = segments_and_entity
 
     # export to dot
-    dot_file = tmp_path / "prov.dot"
-    save_prov_to_dot(prov_tracer, dot_file)
-    dot_text = dot_file.read_text()
+    dot_buffer = io.StringIO()
+    save_prov_to_dot(prov_tracer, dot_buffer)
+    dot_text = dot_buffer.getvalue()
+    dot_lines = set(dot_text.splitlines(keepends=True))
 
     # check dot entries
-    assert f'"{sentence_segment.uid}" [label="sentence: This is a sentence."];\n' in dot_text
-    assert f'"{syntagma_segment.uid}" [label="syntagma: a sentence"];\n' in dot_text
-    assert f'"{entity.uid}" [label="word: sentence"];\n' in dot_text
-    assert f'"{sentence_segment.uid}" -> "{syntagma_segment.uid}"' ' [label="SyntagmaTokenizer"];\n' in dot_text
-    assert f'"{syntagma_segment.uid}" -> "{entity.uid}" [label="EntityMatcher"];\n' in dot_text
+    expected_lines = {
+        f'"{sentence_segment.uid}" [label="sentence: This is a sentence."];\n',
+        f'"{syntagma_segment.uid}" [label="syntagma: a sentence"];\n',
+        f'"{entity.uid}" [label="word: sentence"];\n',
+    }
+    assert expected_lines - dot_lines == set()
+    assert set(expected_edges.values()) - _get_edges(dot_text) == set()
 
 
-def test_custom_format(tmp_path):
-    """Custom data item and operation formatters"""
-    # build provenance
-    sentence_segment, syntagma_segment, entity = _get_segment_and_entity()
-    prov_tracer = ProvTracer()
-    _build_prov(prov_tracer, sentence_segment, syntagma_segment, entity)
+@pytest.mark.parametrize("path_type", [str, Path, PurePath])
+def test_save_to_file(tmp_path, prov_tracer, path_type):
+    """Export to a file path"""
+    dot_buffer = io.StringIO()
+    save_prov_to_dot(prov_tracer, dot_buffer)
 
     dot_file = tmp_path / "prov.dot"
+    save_prov_to_dot(prov_tracer, path_type(dot_file))
+    assert dot_file.read_text() == dot_buffer.getvalue()
+
+
+def test_custom_format(prov_tracer, segments_and_entity):
+    """Custom data item and operation formatters"""
+    sentence_segment, syntagma_segment, _ = segments_and_entity
+
+    dot_buffer = io.StringIO()
     save_prov_to_dot(
         prov_tracer,
-        dot_file,
+        dot_buffer,
         # change formatting
         data_item_formatters={Segment: lambda s: s.text},
         op_formatter=lambda o: f"Operation: {o.name}",
     )
-    dot_text = dot_file.read_text()
+    dot_text = dot_buffer.getvalue()
+    dot_lines = set(dot_text.splitlines(keepends=True))
 
     # check dot entries
     # segments are formatted differently
-    assert f'"{sentence_segment.uid}" [label="This is a sentence."];\n' in dot_text
+    assert f'"{sentence_segment.uid}" [label="This is a sentence."];\n' in dot_lines
     # operations are formatted differently
-    assert (
-        f'"{sentence_segment.uid}" -> "{syntagma_segment.uid}"' ' [label="Operation: SyntagmaTokenizer"];\n' in dot_text
-    )
+    assert (sentence_segment.uid, syntagma_segment.uid, "Operation: SyntagmaTokenizer") in _get_edges(dot_text)
 
 
-def test_attrs(tmp_path):
+def test_attrs():
     """Display attribute links"""
     # build provenance
     sentence_segment, syntagma_segment, entity = _get_segment_and_entity(with_attr=True)
@@ -81,41 +124,59 @@ def test_attrs(tmp_path):
     _build_prov(prov_tracer, sentence_segment, syntagma_segment, entity)
 
     # export to dot
-    dot_file = tmp_path / "prov.dot"
-    save_prov_to_dot(prov_tracer, dot_file)
-    dot_text = dot_file.read_text()
+    dot_buffer = io.StringIO()
+    save_prov_to_dot(prov_tracer, dot_buffer)
+    dot_lines = set(dot_buffer.getvalue().splitlines(keepends=True))
 
-    # check attribute link in dot entries
+    # check attribute link in dot entries, including its styling
     attr = entity.attrs.get()[0]
-    assert f'"{entity.uid}" -> "{attr.uid}" [style=dashed, color=grey,' ' label="attr", fontcolor=grey];\n' in dot_text
+    assert f'"{entity.uid}" -> "{attr.uid}" [style=dashed, color=grey,' ' label="attr", fontcolor=grey];\n' in dot_lines
 
 
-def test_sub_prov(tmp_path):
-    """Handling of nested provenance tracers"""
+@pytest.fixture(scope="module")
+def prov_tracer_with_sub_prov(segments_and_entity):
     prov_tracer = ProvTracer()
 
     # build provenance for inner graph
-    sentence_segment, syntagma_segment, entity = _get_segment_and_entity()
+    entity = segments_and_entity[2]
     sub_prov_tracer = ProvTracer(store=prov_tracer.store)
-    _build_prov(sub_prov_tracer, sentence_segment, syntagma_segment, entity)
+    _build_prov(sub_prov_tracer, *segments_and_entity)
 
     # wrap it in outer pipeline graph
     pipeline_desc = OperationDescription(uid=generate_id(), name="Pipeline")
     prov_tracer.add_prov_from_sub_tracer([entity], pipeline_desc, sub_prov_tracer)
-
-    # render dot, not expanding sub provenance
-    dot_file = tmp_path / "prov.dot"
-    save_prov_to_dot(prov_tracer, dot_file, max_sub_prov_depth=0)
-    dot_text = dot_file.read_text()
-
-    # must have a dot entry for outer pipeline operation
-    assert f'"{sentence_segment.uid}" -> "{entity.uid}" [label="Pipeline"];\n' in dot_text
-
-    # render dot, expanding all sub provenance
-    dot_file_full = tmp_path / "prov_full.dot"
-    save_prov_to_dot(prov_tracer, dot_file_full, max_sub_prov_depth=None)
-    dot_text_full = dot_file_full.read_text()
-
-    # must have a dot entry for inner operations in sub provenance
-    assert f'"{sentence_segment.uid}" -> "{syntagma_segment.uid}"' ' [label="SyntagmaTokenizer"];\n' in dot_text_full
-    assert f'"{syntagma_segment.uid}" -> "{entity.uid}" [label="EntityMatcher"];\n' in dot_text_full
+    return prov_tracer
+
+
+@pytest.mark.parametrize(
+    ("max_sub_prov_depth", "expected_ops", "unexpected_ops"),
+    [
+        # not expanding sub provenance, only outer pipeline operation is visible
+        (0, ["Pipeline"], ["SyntagmaTokenizer", "EntityMatcher"]),
+        # expanding all sub provenance, inner operations replace the pipeline
+        (None, ["SyntagmaTokenizer", "EntityMatcher"], ["Pipeline"]),
+    ],
+)
+def test_sub_prov(
+    prov_tracer_with_sub_prov,
+    segments_and_entity,
+    expected_edges,
+    max_sub_prov_depth,
+    expected_ops,
+    unexpected_ops,
+):
+    """Handling of nested provenance tracers"""
+    sentence_segment, _, entity = segments_and_entity
+    edges_by_op = {
+        **expected_edges,
+        "Pipeline": (sentence_segment.uid, entity.uid, "Pipeline"),
+    }
+
+    dot_buffer = io.StringIO()
+    save_prov_to_dot(prov_tracer_with_sub_prov, dot_buffer, max_sub_prov_depth=max_sub_prov_depth)
+    edges = _get_edges(dot_buffer.getvalue())
+
+    for op_name in expected_ops:
+        assert edges_by_op[op_name] in edges
+    for op_name in unexpected_ops:
+        assert edges_by_op[op_name] not in edges